@@ -1,6 +1,8 @@
 import glob
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
 
 import numpy as np
 import tifffile as tiff
@@ -46,7 +48,7 @@ class UPTIReader(ReaderBase):
 
         if extract_data:
             for i in range(self.positions):
-                self._create_position_array(i)
+                self._create_position_zarr(i)
 
     def _map_files(self):
         """
@@ -102,7 +104,33 @@ class UPTIReader(ReaderBase):
                 key=lambda x: re.sub(r"State_\d\d\d", "", x)
             )
 
-    def _create_position_array(self, pos):
+    def _create_position_ndarray(self, pos):
+        """
+        reads all of the tiff data into an in-memory numpy array
+        for a given position
+
+        Parameters
+        ----------
+        pos:            (int) index of the position to read
+
+        Returns
+        -------
+        data:           (nd-array) numpy array of dimensions (T, C, Z, Y, X)
+
+        """
+
+        data = np.empty(self.shape, dtype=self.dtype)
+        # every plane is a separate file, so overlap the reads
+        coords = list(product(range(self.channels), range(self.slices)))
+        with ThreadPoolExecutor(
+            max_workers=min(len(coords), os.cpu_count() or 1)
+        ) as executor:
+            images = executor.map(lambda cz: self._get_image(*cz), coords)
+            for (c, z), img in zip(coords, images):
+                data[:, c, z] = img
+        return data
+
+    def _create_position_zarr(self, pos):
         """
         maps all of the tiff data into a virtual zarr store in memory
         for a given position
@@ -116,24 +144,12 @@ class UPTIReader(ReaderBase):
 
         """
 
-        self.position_arrays[pos] = zarr.zeros(
-            shape=(
-                self.frames,
-                self.channels,
-                self.slices,
-                self.height,
-                self.width,
-            ),
-            chunks=(1, 1, 1, self.height, self.width),
-            dtype=self.dtype,
+        # compress once from the in-memory array
+        # instead of one zarr write per plane
+        self.position_arrays[pos] = zarr.array(
+            self._create_position_ndarray(pos),
+            chunks=(self.frames, 1, 1, self.height, self.width),
         )
-        # add all the images with this specific dimension.
-        # Will be blank images if dataset
-        # is incomplete
-        for t in range(self.frames):
-            for c in range(self.channels):
-                for z in range(self.slices):
-                    self.position_arrays[pos][t, c, z] = self._get_image(c, z)
 
     def _get_image(self, c, z):
         """
@@ -159,7 +175,7 @@ class UPTIReader(ReaderBase):
         state_idx = 0 if not state else int(state.group(0).strip("State_"))
 
         fn = self.file_map[(pattern, state_idx, z)]
-        img = zarr.open(tiff.imread(fn, aszarr=True), "r")
+        img = tiff.imread(fn)
 
         return img
 
@@ -183,7 +199,7 @@ class UPTIReader(ReaderBase):
             )
 
         if position not in self.position_arrays.keys():
-            self._create_position_array(position)
+            self._create_position_zarr(position)
         return self.position_arrays[position]
 
     def get_array(self, position):
@@ -207,11 +223,10 @@ class UPTIReader(ReaderBase):
                 "the number of positions in the data"
             )
 
-        # if position hasn't been initialized in memory, do that.
-        if position not in self.position_arrays.keys():
-            self._create_position_array(position)
-
-        return np.array(self.position_arrays[position])
+        if position in self.position_arrays.keys():
+            return self.position_arrays[position][:]
+        # read the files directly instead of going through a zarr array
+        return self._create_position_ndarray(position)
 
     def get_num_positions(self) -> int:
         return self.positions
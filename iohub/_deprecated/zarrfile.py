@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import logging
 import os
-from copy import copy
 from typing import Literal
 
 import numpy as np
@@ -244,10 +243,13 @@ class ZarrReader(ReaderBase):
         out:            (dict) flattened dictionary
         """
 
-        out = copy(stage_pos)
-        out.pop("DevicePositions")
-        for dev_pos in stage_pos["DevicePositions"]:
-            out.update({dev_pos["Device"]: dev_pos["Position_um"]})
+        out = {k: v for k, v in stage_pos.items() if k != "DevicePositions"}
+        out.update(
+            {
+                dev_pos["Device"]: dev_pos["Position_um"]
+                for dev_pos in stage_pos["DevicePositions"]
+            }
+        )
         return out
 
     def _simplify_stage_position_beta(self, stage_pos: dict):
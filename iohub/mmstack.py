@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-from copy import copy
 from pathlib import Path
 from typing import TYPE_CHECKING, Iterable
 from warnings import catch_warnings, filterwarnings
@@ -186,70 +185,48 @@ class MMStack(MicroManagerFOVMapping):
     def _set_mm_meta(self, mm_meta: dict) -> None:
         """Assign image metadata from summary metadata."""
         self._mm_meta = mm_meta
-        self.channel_names = []
-        mm_version = self._mm_meta["Summary"]["MicroManagerVersion"]
+        summary = self._mm_meta["Summary"]
+        mm_version = summary["MicroManagerVersion"]
         if "beta" in mm_version:
-            if self._mm_meta["Summary"]["Positions"] > 1:
-                self._stage_positions = []
-
-                for p in range(
-                    len(self._mm_meta["Summary"]["StagePositions"])
-                ):
-                    pos = self._simplify_stage_position_beta(
-                        self._mm_meta["Summary"]["StagePositions"][p]
-                    )
-                    self._stage_positions.append(pos)
-
+            if summary["Positions"] > 1:
+                self._stage_positions = [
+                    self._simplify_stage_position_beta(stage_pos)
+                    for stage_pos in summary["StagePositions"]
+                ]
             # MM beta versions sometimes don't have 'ChNames',
-            # so I'm wrapping in a try-except and setting the
-            # channel names to empty strings if it fails.
-            try:
-                for ch in self._mm_meta["Summary"]["ChNames"]:
-                    self.channel_names.append(ch)
-            except Exception:
-                self.channel_names = self._mm_meta["Summary"]["Channels"] * [
-                    ""
-                ]  # empty strings
-
+            # so the channel names are set to empty strings instead.
+            channel_names = summary.get("ChNames")
+            if channel_names is None:
+                channel_names = summary["Channels"] * [""]
         elif mm_version == "1.4.22":
-            for ch in self._mm_meta["Summary"].get("ChNames", []):
-                self.channel_names.append(ch)
-
+            channel_names = summary.get("ChNames", [])
         # Parsing of data acquired with the OpenCell
         # acquisition script on the Dragonfly miroscope
         elif (
             mm_version == "2.0.1 20220920"
-            and self._mm_meta["Summary"].get("Prefix", None) == "raw_data"
+            and summary.get("Prefix", None) == "raw_data"
         ):
             files = natsorted(self.root.glob("*.ome.tif"))
             self.positions = len(files)  # not all positions are saved
-
-            if self._mm_meta["Summary"]["Positions"] > 1:
-                self._stage_positions = [None] * self.positions
-
-                for p_idx, file_name in enumerate(files):
-                    site_idx = int(str(file_name).split("_")[-1].split("-")[0])
-                    pos = self._simplify_stage_position(
-                        self._mm_meta["Summary"]["StagePositions"][site_idx]
+            if summary["Positions"] > 1:
+                self._stage_positions = [
+                    self._simplify_stage_position(
+                        summary["StagePositions"][
+                            int(str(file_name).split("_")[-1].split("-")[0])
+                        ]
                     )
-                    self._stage_positions[p_idx] = pos
-
-            for ch in self._mm_meta["Summary"]["ChNames"]:
-                self.channel_names.append(ch)
-
+                    for file_name in files
+                ]
+            channel_names = summary["ChNames"]
         else:
-            if self._mm_meta["Summary"].get("Positions", 1) > 1:
-                self._stage_positions = []
-
-                for p in range(self._mm_meta["Summary"]["Positions"]):
-                    pos = self._simplify_stage_position(
-                        self._mm_meta["Summary"]["StagePositions"][p]
-                    )
-                    self._stage_positions.append(pos)
-
-            for ch in self._mm_meta["Summary"].get("ChNames", []):
-                self.channel_names.append(ch)
-        z_step_size = float(self._mm_meta["Summary"].get("z-step_um", 1.0))
+            if (positions := summary.get("Positions", 1)) > 1:
+                self._stage_positions = [
+                    self._simplify_stage_position(summary["StagePositions"][p])
+                    for p in range(positions)
+                ]
+            channel_names = summary.get("ChNames", [])
+        self.channel_names = list(channel_names)
+        z_step_size = float(summary.get("z-step_um", 1.0))
         if z_step_size == 0:
             if self.slices == 1:
                 z_step_size = 1.0
@@ -259,11 +236,9 @@ class MMStack(MicroManagerFOVMapping):
                     "Using 1.0 um instead."
                 )
         self._z_step_size = z_step_size
-        self.height = self._mm_meta["Summary"]["Height"]
-        self.width = self._mm_meta["Summary"]["Width"]
-        self._t_scale = (
-            float(self._mm_meta["Summary"].get("Interval_ms", 1e3)) / 1e3
-        )
+        self.height = summary["Height"]
+        self.width = summary["Width"]
+        self._t_scale = float(summary.get("Interval_ms", 1e3)) / 1e3
 
     def _simplify_stage_position(self, stage_pos: dict):
         """
@@ -281,10 +256,13 @@ class MMStack(MicroManagerFOVMapping):
             flattened dictionary
         """
 
-        out = copy(stage_pos)
-        out.pop("DevicePositions")
-        for dev_pos in stage_pos["DevicePositions"]:
-            out.update({dev_pos["Device"]: dev_pos["Position_um"]})
+        out = {k: v for k, v in stage_pos.items() if k != "DevicePositions"}
+        out.update(
+            {
+                dev_pos["Device"]: dev_pos["Position_um"]
+                for dev_pos in stage_pos["DevicePositions"]
+            }
+        )
         return out
 
     def _simplify_stage_position_beta(self, stage_pos: dict) -> dict:
@@ -8,14 +8,20 @@ from __future__ import annotations
 import logging
 import math
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from copy import deepcopy
+from functools import lru_cache
 from typing import TYPE_CHECKING, Generator, Literal, Sequence, Type
 
 import numpy as np
+import pandas as pd
 import zarr
 from numcodecs import Blosc
 from numpy.typing import ArrayLike, DTypeLike, NDArray
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
+from zarr.indexing import BlockIndex, OIndex, VIndex
 from zarr.util import normalize_storage_path
 
 from iohub.ngff.display import channel_display_settings
@@ -44,18 +50,33 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+_AXES_ADAPTER = TypeAdapter(list[AxisMeta])
 
+# row, column and position names repeat across every node access
+_norm_path = lru_cache(maxsize=8192)(normalize_storage_path)
+
+# upper bound of the default chunk size of image arrays
+_MAX_CHUNK_BYTES = 16 << 20
+
+
+@lru_cache(maxsize=256)
 def _pad_shape(shape: tuple[int], target: int = 5):
     """Pad shape tuple to a target length."""
     pad = target - len(shape)
     return (1,) * pad + shape
 
 
+def _path_is_local(store_path: StrOrBytesPath) -> bool:
+    """Whether the store path is a local path rather than a URI."""
+    return "://" not in os.fsdecode(store_path)
+
+
 def _open_store(
     store_path: StrOrBytesPath,
     mode: Literal["r", "r+", "a", "w", "w-"],
     version: Literal["0.1", "0.4"],
     synchronizer=None,
+    use_consolidated: bool = False,
 ):
     if not os.path.isdir(store_path) and mode in ("r", "r+"):
         raise FileNotFoundError(
@@ -73,7 +94,13 @@ def _open_store(
         store = zarr.DirectoryStore(
             store_path, dimension_separator=dimension_separator
         )
-        root = zarr.open_group(store, mode=mode, synchronizer=synchronizer)
+        if use_consolidated and mode == "r" and ".zmetadata" in store:
+            # read all group and array metadata from a single file
+            root = zarr.open_consolidated(
+                store, mode=mode, synchronizer=synchronizer
+            )
+        else:
+            root = zarr.open_group(store, mode=mode, synchronizer=synchronizer)
     except Exception as e:
         raise RuntimeError(
             f"Cannot open Zarr root group at {store_path}"
@@ -89,13 +116,38 @@ def _scale_integers(values: Sequence[int], factor: int) -> tuple[int, ...]:
 class NGFFNode:
     """A node (group level in Zarr) in an NGFF dataset."""
 
+    # a full plate traversal creates one node per group
+    __slots__ = (
+        "_group",
+        "_channel_names",
+        "axes",
+        "_overwrite",
+        "_version",
+        "_metadata",
+        "_raw_meta",
+        "_member_cache",
+        "_meta_json",
+        "_batch_depth",
+        "_dump_pending",
+        "_child_attrs_cache",
+        "_consolidate_on_close",
+    )
     _MEMBER_TYPE: Type[NGFFNode]
+    # member types by depth below the node
+    _MEMBER_CHAIN: tuple[type, ...]
     _DEFAULT_AXES = [
         TimeAxisMeta(name="T", unit="second"),
         ChannelAxisMeta(name="C"),
         *[SpaceAxisMeta(name=i, unit="micrometer") for i in ("Z", "Y", "X")],
     ]
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._MEMBER_CHAIN = (
+            cls._MEMBER_TYPE,
+            *getattr(cls._MEMBER_TYPE, "_MEMBER_CHAIN", ()),
+        )
+
     def __init__(
         self,
         group: zarr.Group,
@@ -104,6 +156,7 @@ class NGFFNode:
         axes: list[AxisMeta] | None = None,
         version: Literal["0.1", "0.4"] = "0.4",
         overwriting_creation: bool = False,
+        consolidate_on_close: bool = False,
     ):
         if channel_names:
             self._channel_names = channel_names
@@ -116,6 +169,14 @@ class NGFFNode:
         self._group = group
         self._overwrite = overwriting_creation
         self._version = version
+        self._metadata = None
+        self._raw_meta = None
+        self._member_cache = None
+        self._meta_json = None
+        self._batch_depth = 0
+        self._dump_pending = False
+        self._child_attrs_cache = None
+        self._consolidate_on_close = consolidate_on_close
         if parse_meta:
             self._parse_meta()
         if not hasattr(self, "axes"):
@@ -141,6 +202,29 @@ class NGFFNode:
     def channel_names(self):
         return self._channel_names
 
+    @property
+    def metadata(self):
+        """NGFF metadata model of the node.
+        Validated from `.zattrs` on first access."""
+        if self._metadata is None:
+            if self._raw_meta is None:
+                raise AttributeError(
+                    f"{type(self).__name__} has no NGFF metadata."
+                )
+            try:
+                self._metadata = self._validate_meta(self._raw_meta)
+            except ValidationError as e:
+                self._raw_meta = None
+                self._warn_invalid_meta()
+                raise AttributeError(
+                    f"{type(self).__name__} has invalid NGFF metadata."
+                ) from e
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value):
+        self._metadata = value
+
     @property
     def _parent_path(self):
         """The parent Zarr group path of the node.
@@ -152,31 +236,46 @@ class NGFFNode:
 
     @property
     def _member_names(self):
+        """Sorted member keys.
+        Only cached for read-only groups, since members of a writable group
+        can be added through other node objects of the same group."""
+        if not self._group.read_only:
+            return self._list_members()
+        if self._member_cache is None:
+            self._member_cache = self._list_members()
+        return self._member_cache
+
+    def _list_members(self):
         """Group keys (default) or array keys (overridden)."""
         return self.group_keys()
 
     @property
     def _child_attrs(self):
-        """Attributes to pass on when constructing child type instances"""
-        return dict(
-            version=self._version,
-            axes=self.axes,
-            channel_names=self._channel_names,
-            overwriting_creation=self._overwrite,
-        )
+        """Attributes to pass on when constructing child type instances,
+        cached until the axes or channel names are replaced"""
+        cache = self._child_attrs_cache
+        if (
+            cache is None
+            or cache["axes"] is not self.axes
+            or cache["channel_names"] is not self._channel_names
+        ):
+            cache = self._child_attrs_cache = dict(
+                version=self._version,
+                axes=self.axes,
+                channel_names=self._channel_names,
+                overwriting_creation=self._overwrite,
+            )
+        return cache
 
     def __len__(self):
         return len(self._member_names)
 
     def __getitem__(self, key):
-        key = normalize_storage_path(key)
+        key = _norm_path(key)
         znode = self.zgroup.get(key)
         if not znode:
             raise KeyError(key)
-        levels = len(key.split("/")) - 1
-        item_type = self._MEMBER_TYPE
-        for _ in range(levels):
-            item_type = item_type._MEMBER_TYPE
+        item_type = self._MEMBER_CHAIN[key.count("/")]
         if issubclass(item_type, zarr.Array):
             return item_type(znode)
         else:
@@ -187,12 +286,12 @@ class NGFFNode:
 
     def __delitem__(self, key):
         """.. Warning: this does NOT clean up metadata!"""
-        key = normalize_storage_path(key)
+        key = _norm_path(key)
         if key in self._member_names:
-            del self[key]
+            del self._group[key]
 
     def __contains__(self, key):
-        key = normalize_storage_path(key)
+        key = _norm_path(key)
         return key.lower() in [name.lower() for name in self._member_names]
 
     def __iter__(self):
@@ -211,7 +310,7 @@ class NGFFNode:
         -------
         list[str]
         """
-        return sorted(list(self._group.group_keys()))
+        return sorted(self._group.group_keys())
 
     def array_keys(self):
         """Sorted list of keys to all the child zarrays (if any).
@@ -220,7 +319,7 @@ class NGFFNode:
         -------
         list[str]
         """
-        return sorted(list(self._group.array_keys()))
+        return sorted(self._group.array_keys())
 
     def is_root(self):
         """Whether this node is the root node
@@ -289,21 +388,59 @@ class NGFFNode:
         return self._channel_names.index(name)
 
     def _warn_invalid_meta(self):
-        msg = "Zarr group at {} does not have valid metadata for {}".format(
-            self._group.path, type(self)
+        _logger.warning(
+            "Zarr group at %s does not have valid metadata for %s",
+            self._group.path,
+            type(self),
         )
-        _logger.warning(msg)
 
     def _parse_meta(self):
         """Parse and set NGFF metadata from `.zattrs`."""
         raise NotImplementedError
 
+    def _validate_meta(self, raw_meta: dict):
+        """Build the NGFF metadata model from raw `.zattrs` values."""
+        raise NotImplementedError
+
     def dump_meta(self):
         """Dumps metadata JSON to the `.zattrs` file."""
         raise NotImplementedError
 
+    @contextmanager
+    def batch_metadata(self):
+        """Context manager that defers metadata writes of this node.
+        Calls to `dump_meta()` in the block only mark the metadata as
+        modified, and the `.zattrs` file is written once upon exit.
+
+        Examples
+        --------
+        >>> with plate.batch_metadata():
+        >>>     for row, col, fov in fov_paths:
+        >>>         plate.create_position(row, col, fov)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dump_pending:
+                self._dump_pending = False
+                self.dump_meta()
+
+    def _defer_dump(self) -> bool:
+        """Mark metadata as modified if writes are batched.
+        Returns True if the write should be skipped."""
+        if self._batch_depth:
+            self._dump_pending = True
+            return True
+        return False
+
     def close(self):
-        """Close Zarr store."""
+        """Close Zarr store.
+        Metadata of the hierarchy is consolidated first
+        if the node was opened with ``consolidate_on_close=True``."""
+        if self._consolidate_on_close and not self._group.read_only:
+            zarr.consolidate_metadata(self._group.store)
         self._group.store.close()
 
 
@@ -311,29 +448,38 @@ class ImageArray(zarr.Array):
     """Container object for image stored as a zarr array (up to 5D)"""
 
     def __init__(self, zarray: zarr.Array):
-        super().__init__(
-            store=zarray._store,
-            path=zarray._path,
-            read_only=zarray._read_only,
-            chunk_store=zarray._chunk_store,
-            synchronizer=zarray._synchronizer,
-            cache_metadata=zarray._cache_metadata,
-            cache_attrs=zarray._attrs.cache,
-            partial_decompress=zarray._partial_decompress,
-            write_empty_chunks=zarray._write_empty_chunks,
-            zarr_version=zarray._version,
-            meta_array=zarray._meta_array,
-        )
-        self._get_dims()
+        # take over the state of the opened array
+        # instead of reading its metadata from the store again
+        self.__dict__.update(zarray.__dict__)
+        # indexing helpers hold a reference to the array
+        self._oindex = OIndex(self)
+        self._vindex = VIndex(self)
+        self._blocks = BlockIndex(self)
 
-    def _get_dims(self):
-        (
-            self.frames,
-            self.channels,
-            self.slices,
-            self.height,
-            self.width,
-        ) = _pad_shape(self.shape, target=5)
+    @property
+    def frames(self) -> int:
+        """Size of the time dimension."""
+        return _pad_shape(self.shape, target=5)[0]
+
+    @property
+    def channels(self) -> int:
+        """Size of the channel dimension."""
+        return _pad_shape(self.shape, target=5)[1]
+
+    @property
+    def slices(self) -> int:
+        """Size of the Z dimension."""
+        return _pad_shape(self.shape, target=5)[2]
+
+    @property
+    def height(self) -> int:
+        """Size of the Y dimension."""
+        return _pad_shape(self.shape, target=5)[3]
+
+    @property
+    def width(self) -> int:
+        """Size of the X dimension."""
+        return _pad_shape(self.shape, target=5)[4]
 
     def numpy(self):
         """Return the whole image as an in-RAM NumPy array.
@@ -345,7 +491,8 @@ class ImageArray(zarr.Array):
         import dask.array as da
 
         # Note: Designed to work with zarr DirectoryStore
-        return da.from_zarr(self.store.path, component=self.path)
+        # (chunk store is the directory store for consolidated metadata)
+        return da.from_zarr(self.chunk_store.path, component=self.path)
 
     def downscale(self):
         raise NotImplementedError
@@ -501,6 +648,9 @@ class Position(NGFFNode):
     overwriting_creation : bool, optional
         Whether to overwrite or error upon creating an existing child item,
         by default False
+    consolidate_on_close : bool, optional
+        Whether to consolidate the metadata of the hierarchy
+        upon closing the node, by default False
 
     Attributes
     ----------
@@ -516,6 +666,8 @@ class Position(NGFFNode):
         Axes metadata
     """
 
+    __slots__ = ("_axis_index",)
+
     _MEMBER_TYPE = ImageArray
 
     def __init__(
@@ -526,6 +678,7 @@ class Position(NGFFNode):
         axes: list[AxisMeta] | None = None,
         version: Literal["0.1", "0.4"] = "0.4",
         overwriting_creation: bool = False,
+        consolidate_on_close: bool = False,
     ):
         super().__init__(
             group=group,
@@ -534,40 +687,54 @@ class Position(NGFFNode):
             axes=axes,
             version=version,
             overwriting_creation=overwriting_creation,
+            consolidate_on_close=consolidate_on_close,
         )
+        self._axis_index: tuple[list[AxisMeta], dict[str, int]] | None = None
 
     def _parse_meta(self):
-        multiscales = self.zattrs.get("multiscales")
-        omero = self.zattrs.get("omero")
+        attrs = self.zattrs.asdict()
+        multiscales = attrs.get("multiscales")
+        omero = attrs.get("omero")
         if multiscales and omero:
+            # only read channel names and axes here,
+            # the full model is validated on first access of `metadata`
             try:
-                self.metadata = ImagesMeta(
-                    multiscales=multiscales, omero=omero
-                )
                 self._channel_names = [
-                    c.label for c in self.metadata.omero.channels
+                    c.get("label") for c in omero["channels"]
                 ]
-                self.axes = self.metadata.multiscales[0].axes
-            except ValidationError:
+                self.axes = _AXES_ADAPTER.validate_python(
+                    multiscales[0]["axes"]
+                )
+                self._raw_meta = dict(multiscales=multiscales, omero=omero)
+            except (KeyError, TypeError, IndexError, ValidationError):
                 self._warn_invalid_meta()
         else:
             self._warn_invalid_meta()
 
+    def _validate_meta(self, raw_meta: dict):
+        return ImagesMeta(**raw_meta)
+
     def dump_meta(self):
         """Dumps metadata JSON to the `.zattrs` file."""
-        self.zattrs.update(**self.metadata.model_dump(**TO_DICT_SETTINGS))
+        if self._metadata is None:
+            # metadata was never loaded, so it cannot have changed
+            return
+        if self._defer_dump():
+            return
+        self._meta_json = self.metadata.model_dump(**TO_DICT_SETTINGS)
+        self.zattrs.update(**self._meta_json)
 
-    @property
-    def _storage_options(self):
-        return {
-            "compressor": Blosc(
+    def _storage_options(self, dtype: DTypeLike):
+        if np.dtype(dtype) in (np.uint8, np.uint16):
+            # faster than zstd for typical camera data at similar ratio
+            compressor = Blosc(cname="lz4", clevel=5, shuffle=Blosc.BITSHUFFLE)
+        else:
+            compressor = Blosc(
                 cname="zstd", clevel=1, shuffle=Blosc.BITSHUFFLE
-            ),
-            "overwrite": self._overwrite,
-        }
+            )
+        return {"compressor": compressor, "overwrite": self._overwrite}
 
-    @property
-    def _member_names(self):
+    def _list_members(self):
         return self.array_keys()
 
     @property
@@ -622,7 +789,7 @@ class Position(NGFFNode):
 
     def __setitem__(self, key, value: NDArray):
         """Write an up-to-5D image with default settings."""
-        key = normalize_storage_path(key)
+        key = _norm_path(key)
         if not isinstance(value, np.ndarray):
             raise TypeError(
                 f"Value must be a NumPy array. Got type {type(value)}."
@@ -658,7 +825,8 @@ class Position(NGFFNode):
             Image data.
         chunks : tuple[int], optional
             Chunk size, by default None.
-            ZYX stack size will be used if not specified.
+            ZYX stack size will be used if not specified,
+            with YX halved until a chunk is no larger than 16 MiB.
         transform : list[TransformationMeta], optional
             List of coordinate transformations, by default None.
             Should be specified for a non-native resolution level.
@@ -672,17 +840,81 @@ class Position(NGFFNode):
             Container object for image stored as a zarr array (up to 5D)
         """
         if not chunks:
-            chunks = self._default_chunks(data.shape, 3)
+            chunks = self._default_chunks(data.shape, 3, data.dtype)
         if check_shape:
             self._check_shape(data.shape)
         img_arr = ImageArray(
             self._group.array(
-                name, data, chunks=chunks, **self._storage_options
+                name,
+                data,
+                chunks=chunks,
+                **self._storage_options(data.dtype),
             )
         )
         self._create_image_meta(img_arr.basename, transform=transform)
         return img_arr
 
+    def create_pyramid(
+        self,
+        levels: Sequence[
+            tuple[
+                str,
+                NDArray,
+                tuple[int] | None,
+                list[TransformationMeta] | None,
+            ]
+        ],
+        check_shape: bool = True,
+    ) -> list[ImageArray]:
+        """Create multiple image arrays (e.g. levels of a multi-scale pyramid)
+        in the position.
+        The arrays are compressed and written concurrently in threads.
+
+        Parameters
+        ----------
+        levels : Sequence[tuple]
+            Tuples of ``(name, data, chunks, transform)`` for each image,
+            where the items are the same as the arguments
+            of :py:meth:`create_image`
+        check_shape : bool, optional
+            Whether to check if image shapes match dataset axes,
+            by default True
+
+        Returns
+        -------
+        list[ImageArray]
+            Container objects for the images, in the order of ``levels``
+        """
+        if not levels:
+            return []
+        specs = []
+        for name, data, chunks, _ in levels:
+            if not chunks:
+                chunks = self._default_chunks(data.shape, 3, data.dtype)
+            if check_shape:
+                self._check_shape(data.shape)
+            specs.append((name, data, chunks))
+
+        def _write(spec):
+            name, data, chunks = spec
+            return self._group.array(
+                name,
+                data,
+                chunks=chunks,
+                **self._storage_options(data.dtype),
+            )
+
+        workers = min(len(specs), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            zarrays = list(executor.map(_write, specs))
+        img_arrs = []
+        with self.batch_metadata():
+            for zarray, (*_, transform) in zip(zarrays, levels):
+                img_arr = ImageArray(zarray)
+                self._create_image_meta(img_arr.basename, transform=transform)
+                img_arrs.append(img_arr)
+        return img_arrs
+
     def create_zeros(
         self,
         name: str,
@@ -709,7 +941,8 @@ class Position(NGFFNode):
             Data type.
         chunks : tuple[int], optional
             Chunk size, by default None.
-            ZYX stack size will be used if not specified.
+            ZYX stack size will be used if not specified,
+            with YX halved until a chunk is no larger than 16 MiB.
         transform : list[TransformationMeta], optional
             List of coordinate transformations, by default None.
             Should be specified for a non-native resolution level.
@@ -723,7 +956,7 @@ class Position(NGFFNode):
             Container object for a zero-filled image as a lazy zarr array
         """
         if not chunks:
-            chunks = self._default_chunks(shape, 3)
+            chunks = self._default_chunks(shape, 3, dtype)
         if check_shape:
             self._check_shape(shape)
         img_arr = ImageArray(
@@ -732,16 +965,28 @@ class Position(NGFFNode):
                 shape=shape,
                 dtype=dtype,
                 chunks=chunks,
-                **self._storage_options,
+                **self._storage_options(dtype),
             )
         )
         self._create_image_meta(img_arr.basename, transform=transform)
         return img_arr
 
     @staticmethod
-    def _default_chunks(shape, last_data_dims: int):
+    def _default_chunks(
+        shape, last_data_dims: int, dtype: DTypeLike | None = None
+    ):
         chunks = shape[-min(last_data_dims, len(shape)) :]
-        return _pad_shape(chunks, target=len(shape))
+        chunks = _pad_shape(chunks, target=len(shape))
+        if dtype is None or len(chunks) < 2:
+            return chunks
+        # halve YX until the chunk fits in the size limit
+        *others, y, x = chunks
+        itemsize = np.dtype(dtype).itemsize
+        while math.prod(others) * y * x * itemsize > _MAX_CHUNK_BYTES and (
+            y > 1 or x > 1
+        ):
+            y, x = -(-y // 2), -(-x // 2)
+        return (*others, y, x)
 
     def _check_shape(self, data_shape: tuple[int]):
         if len(data_shape) != len(self.axes):
@@ -749,16 +994,20 @@ class Position(NGFFNode):
                 f"Image has {len(data_shape)} dimensions, "
                 f"while the dataset has {len(self.axes)}."
             )
-        num_ch = len(self.channel_names)
         if ch_axis := self._find_axis("channel"):
-            msg = (
-                f"Image has {data_shape[ch_axis]} channels, "
-                f"while the dataset  has {num_ch}."
-            )
-            if data_shape[ch_axis] > num_ch:
-                raise ValueError(msg)
-            elif data_shape[ch_axis] < num_ch:
-                _logger.warning(msg)
+            data_ch = data_shape[ch_axis]
+            num_ch = len(self.channel_names)
+            if data_ch > num_ch:
+                raise ValueError(
+                    f"Image has {data_ch} channels, "
+                    f"while the dataset has {num_ch}."
+                )
+            elif data_ch < num_ch:
+                _logger.warning(
+                    "Image has %d channels, while the dataset has %d.",
+                    data_ch,
+                    num_ch,
+                )
         else:
             _logger.info(
                 "Dataset channel axis is not set. "
@@ -776,6 +1025,7 @@ class Position(NGFFNode):
         dataset_meta = DatasetMeta(
             path=name, coordinate_transformations=transform
         )
+        appended = None
         if not hasattr(self, "metadata"):
             self.metadata = ImagesMeta(
                 multiscales=[
@@ -797,7 +1047,27 @@ class Position(NGFFNode):
             not in self.metadata.multiscales[0].get_dataset_paths()
         ):
             self.metadata.multiscales[0].datasets.append(dataset_meta)
-        self.dump_meta()
+            appended = dataset_meta
+        self._dump_appended_meta(appended)
+
+    def _dump_appended_meta(self, appended: DatasetMeta | None):
+        """Dump metadata after appending a new dataset entry.
+        Only the new entry is converted to JSON
+        if the full metadata has been dumped before.
+
+        Parameters
+        ----------
+        appended : DatasetMeta | None
+            New dataset entry, None to dump the full metadata
+        """
+        if appended is None or self._meta_json is None:
+            return self.dump_meta()
+        if self._defer_dump():
+            return
+        self._meta_json["multiscales"][0]["datasets"].append(
+            appended.model_dump(**TO_DICT_SETTINGS)
+        )
+        self.zattrs.update(**self._meta_json)
 
     def _omero_meta(
         self,
@@ -828,10 +1098,13 @@ class Position(NGFFNode):
         return omero_meta
 
     def _find_axis(self, axis_type):
-        for i, axis in enumerate(self.axes):
-            if axis.type == axis_type:
-                return i
-        return None
+        # rebuild the lookup table if the axes have been replaced
+        if self._axis_index is None or self._axis_index[0] is not self.axes:
+            type_to_index = {}
+            for i, axis in enumerate(self.axes):
+                type_to_index.setdefault(axis.type, i)
+            self._axis_index = (self.axes, type_to_index)
+        return self._axis_index[1].get(axis_type)
 
     def _get_channel_axis(self):
         if (ch_ax := self._find_axis("channel")) is None:
@@ -856,9 +1129,11 @@ class Position(NGFFNode):
         if chan_name in self._channel_names:
             raise ValueError(f"Channel name '{chan_name}' already exists.")
         self._channel_names.append(chan_name)
+        self._child_attrs_cache = None
         if resize_arrays:
+            resizes = []
+            ch_ax = self._get_channel_axis()
             for _, img in self.images():
-                ch_ax = self._get_channel_axis()
                 shape = list(img.shape)
                 if ch_ax < len(shape):
                     shape[ch_ax] += 1
@@ -869,7 +1144,20 @@ class Position(NGFFNode):
                     raise IndexError(
                         f"Cannot infer channel axis for shape {shape}."
                     )
-                img.resize(shape)
+                resizes.append((img, shape))
+            if len(resizes) > 1:
+                # arrays do not share chunk files
+                workers = min(len(resizes), os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(img.resize, shape)
+                        for img, shape in resizes
+                    ]
+                for future in futures:
+                    future.result()
+            else:
+                for img, shape in resizes:
+                    img.resize(shape)
         if "omero" in self.metadata.model_dump().keys():
             self.metadata.omero.channels.append(
                 channel_display_settings(chan_name)
@@ -1189,6 +1477,8 @@ class TiledPosition(Position):
     :py:class:`iohub.ngff.Position`.
     """
 
+    __slots__ = ()
+
     _MEMBER_TYPE = TiledImageArray
 
     def make_tiles(
@@ -1233,7 +1523,7 @@ class TiledPosition(Position):
                 chunks=self._default_chunks(
                     shape=tile_shape, last_data_dims=chunk_dims
                 ),
-                **self._storage_options,
+                **self._storage_options(dtype),
             )
         )
         self._create_image_meta(tiles.basename, transform=transform)
@@ -1254,6 +1544,9 @@ class Well(NGFFNode):
     overwriting_creation : bool, optional
         Whether to overwrite or error upon creating an existing child item,
         by default False
+    consolidate_on_close : bool, optional
+        Whether to consolidate the metadata of the hierarchy
+        upon closing the node, by default False
 
     Attributes
     ----------
@@ -1265,6 +1558,8 @@ class Well(NGFFNode):
         Zarr attributes of the group
     """
 
+    __slots__ = ()
+
     _MEMBER_TYPE = Position
 
     def __init__(
@@ -1275,6 +1570,7 @@ class Well(NGFFNode):
         axes: list[AxisMeta] | None = None,
         version: Literal["0.1", "0.4"] = "0.4",
         overwriting_creation: bool = False,
+        consolidate_on_close: bool = False,
     ):
         super().__init__(
             group=group,
@@ -1283,16 +1579,22 @@ class Well(NGFFNode):
             axes=axes,
             version=version,
             overwriting_creation=overwriting_creation,
+            consolidate_on_close=consolidate_on_close,
         )
 
     def _parse_meta(self):
         if well_group_meta := self.zattrs.get("well"):
-            self.metadata = WellGroupMeta(**well_group_meta)
+            self._raw_meta = well_group_meta
         else:
             self._warn_invalid_meta()
 
+    def _validate_meta(self, raw_meta: dict):
+        return WellGroupMeta(**raw_meta)
+
     def dump_meta(self):
         """Dumps metadata JSON to the `.zattrs` file."""
+        if self._metadata is None or self._defer_dump():
+            return
         self.zattrs.update(
             {"well": self.metadata.model_dump(**TO_DICT_SETTINGS)}
         )
@@ -1358,6 +1660,9 @@ class Row(NGFFNode):
     overwriting_creation : bool, optional
         Whether to overwrite or error upon creating an existing child item,
         by default False
+    consolidate_on_close : bool, optional
+        Whether to consolidate the metadata of the hierarchy
+        upon closing the node, by default False
 
     Attributes
     ----------
@@ -1369,6 +1674,8 @@ class Row(NGFFNode):
         Zarr attributes of the group
     """
 
+    __slots__ = ()
+
     _MEMBER_TYPE = Well
 
     def __init__(
@@ -1379,6 +1686,7 @@ class Row(NGFFNode):
         axes: list[AxisMeta] | None = None,
         version: Literal["0.1", "0.4"] = "0.4",
         overwriting_creation: bool = False,
+        consolidate_on_close: bool = False,
     ):
         super().__init__(
             group=group,
@@ -1387,6 +1695,7 @@ class Row(NGFFNode):
             axes=axes,
             version=version,
             overwriting_creation=overwriting_creation,
+            consolidate_on_close=consolidate_on_close,
         )
 
     def __getitem__(self, key: str):
@@ -1421,6 +1730,15 @@ class Row(NGFFNode):
 
 
 class Plate(NGFFNode):
+    __slots__ = (
+        "_name",
+        "_acquisitions",
+        "_row_set",
+        "_col_set",
+        "_known_idx",
+        "_position_cache",
+    )
+
     _MEMBER_TYPE = Row
 
     @classmethod
@@ -1479,7 +1797,7 @@ class Plate(NGFFNode):
                     f"Expected item type {type(Position)}, "
                     f"got {type(src_pos)}"
                 )
-            name = normalize_storage_path(name)
+            name = _norm_path(name)
             if name in plate.zgroup:
                 raise FileExistsError(
                     f"Duplicate name '{name}' after path normalization."
@@ -1488,7 +1806,7 @@ class Plate(NGFFNode):
             _ = plate.create_position(row, col, fov)
             # overwrite position group
             _ = zarr.copy_store(
-                src_pos.zgroup.store,
+                src_pos.zgroup.chunk_store,
                 plate.zgroup.store,
                 source_path=src_pos.zgroup.name,
                 dest_path=name,
@@ -1506,6 +1824,7 @@ class Plate(NGFFNode):
         acquisitions: list[AcquisitionMeta] | None = None,
         version: Literal["0.1", "0.4"] = "0.4",
         overwriting_creation: bool = False,
+        consolidate_on_close: bool = False,
     ):
         super().__init__(
             group=group,
@@ -1514,38 +1833,68 @@ class Plate(NGFFNode):
             axes=axes,
             version=version,
             overwriting_creation=overwriting_creation,
+            consolidate_on_close=consolidate_on_close,
         )
         self._name = name
         self._acquisitions = (
             [AcquisitionMeta(id=0)] if not acquisitions else acquisitions
         )
+        self._row_set: set[str] | None = None
+        self._col_set: set[str] | None = None
+        self._known_idx: dict[str, dict[str, int]] | None = None
+        self._position_cache: dict[str, Position] | None = None
 
     def _parse_meta(self):
         if plate_meta := self.zattrs.get("plate"):
             _logger.debug(f"Loading HCS metadata from file: {plate_meta}")
-            self.metadata = PlateMeta(**plate_meta)
+            self._raw_meta = plate_meta
         else:
             self._warn_invalid_meta()
-        for attr in ("_channel_names", "axes"):
-            if not hasattr(self, attr):
-                self._first_pos_attr(attr)
-
-    def _first_pos_attr(self, attr: str):
-        """Get attribute value from the first position."""
-        name = " ".join(attr.split("_")).strip()
-        msg = f"Cannot determine {name}:"
+        missing = [
+            attr
+            for attr in ("_channel_names", "axes")
+            if not hasattr(self, attr)
+        ]
+        if missing:
+            self._first_pos_attrs(missing)
+
+    def _validate_meta(self, raw_meta: dict):
+        return PlateMeta(**raw_meta)
+
+    def _first_pos_attrs(self, attrs: list[str]):
+        """Get attribute values from the first position.
+        The position group is located and its metadata is read only once
+        for all the requested attributes."""
+        msgs = {
+            attr: f"Cannot determine {' '.join(attr.split('_')).strip()}:"
+            for attr in attrs
+        }
         try:
             row_grp = next(self.zgroup.groups())[1]
             well_grp = next(row_grp.groups())[1]
             pos_grp = next(well_grp.groups())[1]
         except StopIteration:
-            _logger.warning(f"{msg} No position is found in the dataset.")
+            for msg in msgs.values():
+                _logger.warning(f"{msg} No position is found in the dataset.")
             return
-        try:
-            pos = Position(pos_grp)
-            setattr(self, attr, getattr(pos, attr))
-        except AttributeError:
-            _logger.warning(f"{msg} Invalid metadata at the first position")
+        # read the raw attributes instead of parsing a position node
+        pos_attrs = pos_grp.attrs.asdict()
+        for attr, msg in msgs.items():
+            try:
+                if attr == "axes":
+                    value = _AXES_ADAPTER.validate_python(
+                        pos_attrs["multiscales"][0]["axes"]
+                    )
+                else:
+                    value = [
+                        c.get("label") for c in pos_attrs["omero"]["channels"]
+                    ]
+            except (KeyError, TypeError, IndexError, ValidationError):
+                _logger.warning(
+                    f"{msg} Invalid metadata at the first position"
+                )
+                continue
+            setattr(self, attr, value)
 
     def dump_meta(self, field_count: bool = False):
         """Dumps metadata JSON to the `.zattrs` file.
@@ -1559,10 +1908,50 @@ class Plate(NGFFNode):
             by default False
         """
         if field_count:
-            self.metadata.field_count = len(list(self.positions()))
-        self.zattrs.update(
-            {"plate": self.metadata.model_dump(**TO_DICT_SETTINGS)}
-        )
+            self.metadata.field_count = self.count_positions()
+        elif self._metadata is None or self._defer_dump():
+            return
+        self._meta_json = self.metadata.model_dump(**TO_DICT_SETTINGS)
+        self.zattrs.update({"plate": self._meta_json})
+
+    def _dump_appended_meta(self, appended: dict[str, list]):
+        """Dump metadata after appending new rows, columns, or wells.
+        Only the new entries are serialized
+        if the full metadata has been dumped before.
+
+        Parameters
+        ----------
+        appended : dict[str, list]
+            New metadata entries keyed by plate field name
+            ('rows', 'columns', or 'wells')
+        """
+        if self._meta_json is None:
+            return self.dump_meta()
+        if self._defer_dump():
+            return
+        for key, entries in appended.items():
+            self._meta_json[key].extend(
+                e.model_dump(**TO_DICT_SETTINGS) for e in entries
+            )
+        self.zattrs.update({"plate": self._meta_json})
+
+    def _index_axes(self):
+        """Build lookup tables of row/column names and indices
+        from the plate metadata."""
+        self._row_set = {row.name for row in self.metadata.rows}
+        self._col_set = {col.name for col in self.metadata.columns}
+        self._known_idx = {"row": {}, "column": {}}
+        for well_index in self.metadata.wells:
+            row_name, col_name = well_index.path.split("/")
+            self._known_idx["row"].setdefault(row_name, well_index.row_index)
+            self._known_idx["column"].setdefault(
+                col_name, well_index.column_index
+            )
+
+    def _reset_axes_index(self):
+        self._row_set = None
+        self._col_set = None
+        self._known_idx = None
 
     def _auto_idx(
         self,
@@ -1574,15 +1963,12 @@ class Plate(NGFFNode):
             return index
         elif not hasattr(self, "metadata"):
             return 0
-        else:
-            part = ["row", "column"].index(axis_name)
-            all_indices = []
-            for well_index in self.metadata.wells:
-                index = getattr(well_index, f"{axis_name}_index")
-                if well_index.path.split("/")[part] == name:
-                    return index
-                all_indices.append(index)
-            return max(all_indices) + 1
+        if self._known_idx is None:
+            self._index_axes()
+        known = self._known_idx[axis_name]
+        if name in known:
+            return known[name]
+        return max(known.values(), default=-1) + 1
 
     def _build_meta(
         self,
@@ -1632,8 +2018,8 @@ class Plate(NGFFNode):
             Well node object
         """
         # normalize input
-        row_name = normalize_storage_path(row_name)
-        col_name = normalize_storage_path(col_name)
+        row_name = _norm_path(row_name)
+        col_name = _norm_path(col_name)
         row_meta = PlateAxisMeta(name=row_name)
         col_meta = PlateAxisMeta(name=col_name)
         row_index = self._auto_idx(row_name, row_index, "row")
@@ -1644,24 +2030,34 @@ class Plate(NGFFNode):
             row_index=row_index,
             column_index=col_index,
         )
+        appended = {"rows": [], "columns": [], "wells": [well_index_meta]}
         if not hasattr(self, "metadata"):
             self._build_meta(row_meta, col_meta, well_index_meta)
+            self._index_axes()
         else:
+            if self._known_idx is None:
+                self._index_axes()
             self.metadata.wells.append(well_index_meta)
+            self._known_idx["row"].setdefault(row_name, row_index)
+            self._known_idx["column"].setdefault(col_name, col_index)
         # create new row if needed
         if row_name not in self:
             row_grp = self.zgroup.create_group(
                 row_meta.name, overwrite=self._overwrite
             )
-            if row_meta not in self.metadata.rows:
+            if row_name not in self._row_set:
                 self.metadata.rows.append(row_meta)
+                self._row_set.add(row_name)
+                appended["rows"].append(row_meta)
         else:
             row_grp = self[row_name].zgroup
-        if col_meta not in self.metadata.columns:
+        if col_name not in self._col_set:
             self.metadata.columns.append(col_meta)
+            self._col_set.add(col_name)
+            appended["columns"].append(col_meta)
         # create well
         well_grp = row_grp.create_group(col_name, overwrite=self._overwrite)
-        self.dump_meta()
+        self._dump_appended_meta(appended)
         return Well(group=well_grp, parse_meta=False, **self._child_attrs)
 
     def create_position(
@@ -1699,8 +2095,8 @@ class Plate(NGFFNode):
         Position
             Position node object
         """
-        row_name = normalize_storage_path(row_name)
-        col_name = normalize_storage_path(col_name)
+        row_name = _norm_path(row_name)
+        col_name = _norm_path(col_name)
         well_path = os.path.join(row_name, col_name)
         if well_path in self.zgroup:
             well = self[well_path]
@@ -1734,18 +2130,141 @@ class Plate(NGFFNode):
             for _, well in row.wells():
                 yield well.zgroup.path, well
 
-    def positions(self) -> Generator[tuple[str, Position], None, None]:
+    def position_paths(self) -> Generator[str, None, None]:
+        """Returns a generator that iterate over the paths
+        of all the positions in the plate,
+        in the same order as :py:meth:`positions`.
+        Position nodes are not constructed,
+        and only the position groups of each well are listed.
+
+        Yields
+        ------
+        str
+            Path of the position group.
+        """
+        for well_path, well in self.wells():
+            for name in well.group_keys():
+                yield f"{well_path}/{name}"
+
+    def positions_table(self) -> pd.DataFrame:
+        """Returns a table of all the positions in the plate,
+        in the same order as :py:meth:`positions`.
+        Position nodes are not constructed (see :py:meth:`position_paths`).
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per position, with columns
+            'row', 'column', 'position' (names of the groups),
+            'well' ('row/column'), and 'path' ('row/column/position').
+        """
+        paths = list(self.position_paths())
+        table = pd.DataFrame(
+            [path.split("/")[-3:] for path in paths],
+            columns=["row", "column", "position"],
+        )
+        table["well"] = table["row"] + "/" + table["column"]
+        table["path"] = paths
+        return table
+
+    def positions(
+        self, prefetch: int = 0
+    ) -> Generator[tuple[str, Position], None, None]:
         """Returns a generator that iterate over the path and value
         of all the positions (along rows, columns, and wells) in the plate.
 
+        Parameters
+        ----------
+        prefetch : int, optional
+            Number of wells to open ahead of the caller in background threads,
+            which hides latency on remote or network file systems,
+            by default 0 (open positions serially)
+
         Yields
         ------
         [str, Position]
             Path and position object.
+
+        Notes
+        -----
+        For read-only plates, the position objects of the first
+        complete traversal are cached and reused by later calls.
+        See :py:meth:`invalidate_position`.
         """
-        for _, well in self.wells():
-            for _, position in well.positions():
-                yield position.zgroup.path, position
+        if self._position_cache is not None:
+            yield from self._position_cache.items()
+            return
+        cache = {} if self._group.read_only else None
+        for path, position in self._open_positions(prefetch):
+            if cache is not None:
+                cache[path] = position
+            yield path, position
+        self._position_cache = cache
+
+    def invalidate_position(self, path: str | None = None):
+        """Reopen position objects cached by :py:meth:`positions`
+        from the store.
+
+        Parameters
+        ----------
+        path : str, optional
+            Path of the position to reopen ('row/column/position'),
+            by default None (drop all the cached positions)
+        """
+        if path is None or self._position_cache is None:
+            self._position_cache = None
+            return
+        path = _norm_path(path)
+        if path not in self._position_cache:
+            return
+        try:
+            self._position_cache[path] = self[path]
+        except KeyError:
+            del self._position_cache[path]
+
+    def _open_positions(
+        self, prefetch: int
+    ) -> Generator[tuple[str, Position], None, None]:
+        if prefetch < 1:
+            for _, well in self.wells():
+                for _, position in well.positions():
+                    yield position.zgroup.path, position
+            return
+
+        def _well_positions(well: Well) -> list[Position]:
+            return [position for _, position in well.positions()]
+
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        pending = deque()
+        try:
+            for _, well in self.wells():
+                pending.append(executor.submit(_well_positions, well))
+                if len(pending) < prefetch:
+                    continue
+                for position in pending.popleft().result():
+                    yield position.zgroup.path, position
+            while pending:
+                for position in pending.popleft().result():
+                    yield position.zgroup.path, position
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def count_positions(self) -> int:
+        """Count all the positions in the plate.
+        Only the Zarr hierarchy is traversed,
+        so no position metadata is parsed.
+
+        Returns
+        -------
+        int
+            Number of position groups
+        """
+        return sum(
+            1
+            for _, row_grp in self.zgroup.groups()
+            for _, well_grp in row_grp.groups()
+            for _ in well_grp.group_keys()
+        )
 
     def rename_well(
         self,
@@ -1763,8 +2282,8 @@ class Plate(NGFFNode):
         """
 
         # normalize inputs
-        old = normalize_storage_path(old)
-        new = normalize_storage_path(new)
+        old = _norm_path(old)
+        new = _norm_path(new)
         old_row, old_column = old.split("/")
         new_row, new_column = new.split("/")
         new_row_meta = PlateAxisMeta(name=new_row)
@@ -1800,9 +2319,18 @@ class Plate(NGFFNode):
                 col for col in self.metadata.columns if col.name != old_column
             ]
 
+        self._reset_axes_index()
         self.dump_meta()
 
 
+# root metadata key required by each layout, and the node type to open
+_LAYOUT_DISPATCH: dict[str, tuple[str, Type[NGFFNode]]] = {
+    "fov": ("multiscales", Position),
+    "tiled": ("multiscales", TiledPosition),
+    "hcs": ("plate", Plate),
+}
+
+
 def open_ome_zarr(
     store_path: StrOrBytesPath,
     layout: Literal["auto", "fov", "hcs", "tiled"] = "auto",
@@ -1811,6 +2339,8 @@ def open_ome_zarr(
     axes: list[AxisMeta] | None = None,
     version: Literal["0.1", "0.4"] = "0.4",
     synchronizer: zarr.ThreadSynchronizer | zarr.ProcessSynchronizer = None,
+    consolidate_on_close: bool = False,
+    use_consolidated: bool = False,
     **kwargs,
 ) -> Plate | Position | TiledPosition:
     """Convenience method to open OME-Zarr stores.
@@ -1855,6 +2385,22 @@ def open_ome_zarr(
         OME-NGFF version, by default "0.4"
     synchronizer : object, optional
         Zarr thread or process synchronizer, by default None
+    consolidate_on_close : bool, optional
+        Whether to write consolidated metadata (``.zmetadata``)
+        for the whole hierarchy when the node is closed,
+        so that later read-only opens with ``use_consolidated=True``
+        load all the metadata from a single file, by default False.
+        Ignored in read-only mode.
+        Note that consolidated metadata is not updated
+        by later writes without this option.
+    use_consolidated : bool, optional
+        Whether to read the metadata of the hierarchy
+        from consolidated metadata (``.zmetadata``) if it exists,
+        by default False.
+        Only use this if the store has not been modified
+        since it was consolidated,
+        otherwise later changes will not be visible.
+        Ignored in writable modes.
     kwargs : dict, optional
         Keyword arguments to underlying NGFF node constructor,
         by default None
@@ -1868,20 +2414,27 @@ def open_ome_zarr(
         :py:class:`iohub.ngff.Plate`,
         or :py:class:`iohub.ngff.TiledPosition`)
     """
+    if not _path_is_local(store_path):
+        raise ValueError(
+            f"Only local file system paths are supported, got '{store_path}'."
+        )
+    exists = os.path.exists(store_path)
     if mode == "a":
-        mode = ("w-", "r+")[int(os.path.exists(store_path))]
+        mode = "r+" if exists else "w-"
     parse_meta = False
     if mode in ("r", "r+"):
         parse_meta = True
     elif mode == "w-":
-        if os.path.exists(store_path):
+        if exists:
             raise FileExistsError(store_path)
     elif mode == "w":
-        if os.path.exists(store_path):
+        if exists:
             _logger.warning(f"Overwriting data at {store_path}")
     else:
         raise ValueError(f"Invalid persistence mode '{mode}'.")
-    root = _open_store(store_path, mode, version, synchronizer)
+    root = _open_store(
+        store_path, mode, version, synchronizer, use_consolidated
+    )
     meta_keys = root.attrs.keys() if parse_meta else []
     if layout == "auto":
         if parse_meta:
@@ -1899,21 +2452,19 @@ def open_ome_zarr(
             raise ValueError(
                 "Store layout must be specified when creating a new dataset."
             )
-    msg = f"Specified layout '{layout}' does not match existing metadata."
-    if layout in ("fov", "tiled"):
-        if parse_meta and "multiscales" not in meta_keys:
-            raise ValueError(msg)
-        node = TiledPosition if layout == "tiled" else Position
-    elif layout == "hcs":
-        if parse_meta and "plate" not in meta_keys:
-            raise ValueError(msg)
-        node = Plate
-    else:
-        raise ValueError(f"Unknown layout: {layout}")
+    try:
+        required_key, node = _LAYOUT_DISPATCH[layout]
+    except KeyError:
+        raise ValueError(f"Unknown layout: {layout}") from None
+    if parse_meta and required_key not in meta_keys:
+        raise ValueError(
+            f"Specified layout '{layout}' does not match existing metadata."
+        )
     return node(
         group=root,
         parse_meta=parse_meta,
         channel_names=channel_names,
         axes=axes,
+        consolidate_on_close=consolidate_on_close,
         **kwargs,
     )
@@ -56,7 +56,11 @@ def _check_single_page_tiff(src: Path):
         if sub_dirs:
             files = (src / sub_dirs[0]).glob("*.tif")
             try:
-                with tiff.TiffFile(next(files)) as tf:
+                # only the page count is needed,
+                # skip OME-XML parsing and multi-file series linking
+                with tiff.TiffFile(
+                    next(files), is_ome=False, _multifile=False
+                ) as tf:
                     if (
                         len(tf.pages) == 1
                     ):  # and tf.pages[0].is_multipage is False:
@@ -73,7 +77,7 @@ def _check_multipage_tiff(src: Path):
         file = next(src.glob("*.tif"))
     except StopIteration:
         return False
-    with tiff.TiffFile(file) as tf:
+    with tiff.TiffFile(file, _multifile=False) as tf:
         if len(tf.pages) > 1:
             return True
         elif tf.is_multipage is False and tf.is_ome is True:
@@ -23,6 +23,7 @@ if TYPE_CHECKING:
 from iohub.ngff.nodes import (
     TO_DICT_SETTINGS,
     Plate,
+    Position,
     TransformationMeta,
     _open_store,
     _pad_shape,
@@ -108,6 +109,26 @@ def test_pad_shape(shape, target):
     assert new_shape[-len(shape) :] == shape
 
 
+def test_default_chunks_size_limit():
+    """Test `iohub.ngff.Position._default_chunks()`"""
+    shape = (2, 3, 8, 4096, 4096)
+    assert Position._default_chunks(shape, 3) == (1, 1, 8, 4096, 4096)
+    assert Position._default_chunks(shape, 3, "uint16") == (
+        1,
+        1,
+        8,
+        1024,
+        1024,
+    )
+    assert Position._default_chunks(shape, 3, "float32") == (
+        1,
+        1,
+        8,
+        512,
+        512,
+    )
+
+
 def test_open_store_create():
     """Test `iohub.ngff._open_store()"""
     for mode in ("a", "w", "w-"):
@@ -139,6 +160,13 @@ def test_open_store_read_nonexist():
                 _ = _open_store(store_path, mode=mode, version="0.4")
 
 
+@pytest.mark.parametrize("mode", ["r", "a", "w", "w-"])
+def test_open_ome_zarr_remote_uri(mode):
+    """Test `iohub.ngff.open_ome_zarr()` with a URI"""
+    with pytest.raises(ValueError, match="local file system"):
+        _ = open_ome_zarr("s3://bucket/ome.zarr", layout="fov", mode=mode)
+
+
 @given(channel_names=channel_names_st)
 @settings(max_examples=16)
 def test_init_ome_zarr(channel_names):
@@ -246,6 +274,37 @@ def test_write_ome_zarr(channels_and_random_5d, arr_name):
         assert node.data[0].dtype == random_5d.dtype
 
 
+@given(channels_and_random_5d=_channels_and_random_5d())
+@settings(
+    max_examples=16,
+    deadline=2000,
+    suppress_health_check=[HealthCheck.data_too_large],
+)
+def test_create_pyramid(channels_and_random_5d):
+    """Test `iohub.ngff.Position.create_pyramid()`"""
+    channel_names, random_5d = channels_and_random_5d
+    with TemporaryDirectory() as temp_dir:
+        dataset = open_ome_zarr(
+            os.path.join(temp_dir, "ome.zarr"),
+            layout="fov",
+            mode="w-",
+            channel_names=channel_names,
+        )
+        levels = [
+            (str(i), random_5d[..., :: 2**i, :: 2**i], None, None)
+            for i in range(3)
+        ]
+        images = dataset.create_pyramid(levels)
+        assert [img.basename for img in images] == ["0", "1", "2"]
+        assert dataset.metadata.multiscales[0].get_dataset_paths() == [
+            "0",
+            "1",
+            "2",
+        ]
+        for name, data, _, _ in levels:
+            assert_array_almost_equal(dataset[name][:], data)
+
+
 @given(
     ch_shape_dtype=_channels_and_random_5d_shape_and_dtype(),
     arr_name=short_alpha_numeric,
@@ -352,6 +411,62 @@ def test_rename_channel(channels_and_random_5d, arr_name, new_channel):
         assert dataset.metadata.omero.channels[0].label == new_channel
 
 
+@given(channels_and_random_5d=_channels_and_random_5d())
+@settings(
+    max_examples=16,
+    deadline=2000,
+    suppress_health_check=[HealthCheck.data_too_large],
+)
+def test_open_consolidated_plate(channels_and_random_5d):
+    """Test `iohub.ngff.open_ome_zarr()` with consolidated metadata"""
+    channel_names, random_5d = channels_and_random_5d
+    position_list = [("A", "1", "0"), ("B", "2", "0")]
+    with _temp_ome_zarr_plate(
+        random_5d, channel_names, "0", position_list
+    ) as dataset:
+        store_path = dataset.zgroup.store.path
+        zarr.consolidate_metadata(store_path)
+        with open_ome_zarr(
+            store_path, mode="r", use_consolidated=True
+        ) as plate:
+            assert isinstance(
+                plate.zgroup.store, zarr.storage.ConsolidatedMetadataStore
+            )
+            assert plate.channel_names == channel_names
+            positions = dict(plate.positions())
+            assert list(positions) == ["A/1/0", "B/2/0"]
+            for position in positions.values():
+                assert_array_almost_equal(position["0"][:], random_5d)
+                assert_array_almost_equal(
+                    position["0"].dask_array().compute(), random_5d
+                )
+            # read-only plates reuse the positions of the first traversal
+            cached = dict(plate.positions())
+            assert all(cached[k] is v for k, v in positions.items())
+            plate.invalidate_position("A/1/0")
+            reopened = dict(plate.positions())
+            assert reopened["A/1/0"] is not positions["A/1/0"]
+            assert reopened["B/2/0"] is positions["B/2/0"]
+
+
+@given(channels_and_random_5d=_channels_and_random_5d())
+@settings(
+    max_examples=16,
+    deadline=2000,
+    suppress_health_check=[HealthCheck.data_too_large],
+)
+def test_lazy_position_metadata(channels_and_random_5d):
+    """Test `iohub.ngff.Position.metadata` validation on first access"""
+    channel_names, random_5d = channels_and_random_5d
+    with _temp_ome_zarr(random_5d, channel_names, "0") as dataset:
+        with open_ome_zarr(dataset.zgroup.store.path, mode="r") as position:
+            assert position._metadata is None
+            assert position.channel_names == channel_names
+            assert position.axes == dataset.axes
+            assert position._metadata is None
+            assert position.metadata == dataset.metadata
+
+
 @given(
     channels_and_random_5d=_channels_and_random_5d(),
     arr_name=short_alpha_numeric,
@@ -859,6 +974,26 @@ def test_create_well(row_names: list[str], col_names: list[str]):
         assert [
             r["name"] for r in dataset.zattrs["plate"]["rows"]
         ] == row_names
+        for well in dataset.zattrs["plate"]["wells"]:
+            row_name, col_name = well["path"].split("/")
+            assert well["rowIndex"] == row_names.index(row_name)
+            assert well["columnIndex"] == col_names.index(col_name)
+
+
+def test_writable_node_members_not_stale():
+    """Test that a node held by the caller sees members added through
+    another node of the same group"""
+    with TemporaryDirectory() as temp_dir:
+        store_path = os.path.join(temp_dir, "hcs.zarr")
+        with open_ome_zarr(
+            store_path, layout="hcs", mode="a", channel_names=["GFP"]
+        ) as dataset:
+            dataset.create_well("A", "1")
+            row = dataset["A"]
+            assert len(row) == 1
+            dataset.create_well("A", "2")
+            assert len(row) == 2
+            assert "2" in row
 
 
 @given(
@@ -876,6 +1011,173 @@ def test_create_position(row, col, pos):
         assert [r["name"] for r in dataset.zattrs["plate"]["rows"]] == [row]
         assert os.path.isdir(os.path.join(store_path, row, col, pos))
         assert dataset[row][col].metadata.images[0].path == pos
+        assert dataset.count_positions() == 1
+        dataset.dump_meta(field_count=True)
+        assert dataset.zattrs["plate"]["field_count"] == 1
+
+
+@given(col_names=plate_axis_names_st)
+@settings(max_examples=16, deadline=2000)
+def test_plate_batch_metadata(col_names: list[str]):
+    """Test `iohub.ngff.Plate.batch_metadata()`"""
+    with TemporaryDirectory() as temp_dir:
+        store_path = os.path.join(temp_dir, "hcs.zarr")
+        dataset = open_ome_zarr(
+            store_path, layout="hcs", mode="a", channel_names=["GFP"]
+        )
+        with dataset.batch_metadata():
+            for col_name in col_names:
+                _ = dataset.create_position("A", col_name, "0")
+            assert "plate" not in dataset.zattrs
+        assert [
+            c["name"] for c in dataset.zattrs["plate"]["columns"]
+        ] == col_names
+        assert [w["path"] for w in dataset.zattrs["plate"]["wells"]] == [
+            f"A/{c}" for c in col_names
+        ]
+
+
+def test_consolidate_on_close():
+    """Test `iohub.ngff.open_ome_zarr(consolidate_on_close=True)`"""
+    with TemporaryDirectory() as temp_dir:
+        store_path = os.path.join(temp_dir, "hcs.zarr")
+        with open_ome_zarr(
+            store_path,
+            layout="hcs",
+            mode="w-",
+            channel_names=["GFP"],
+            consolidate_on_close=True,
+        ) as plate:
+            for col in ("1", "2"):
+                position = plate.create_position("A", col, "0")
+                position.create_zeros("0", shape=(1, 1, 1, 2, 2), dtype=int)
+        assert os.path.isfile(os.path.join(store_path, ".zmetadata"))
+        with open_ome_zarr(
+            store_path, mode="r", use_consolidated=True
+        ) as plate:
+            assert isinstance(
+                plate.zgroup.store, zarr.storage.ConsolidatedMetadataStore
+            )
+            assert list(plate.position_paths()) == ["A/1/0", "A/2/0"]
+        # append to the store without updating the consolidated metadata
+        with open_ome_zarr(store_path, mode="a") as plate:
+            position = plate.create_position("B", "1", "0")
+            position.create_zeros("0", shape=(1, 1, 1, 2, 2), dtype=int)
+        # consolidated metadata is only read if requested
+        with open_ome_zarr(store_path, mode="r") as plate:
+            assert not isinstance(
+                plate.zgroup.store, zarr.storage.ConsolidatedMetadataStore
+            )
+            assert list(plate.position_paths()) == [
+                "A/1/0",
+                "A/2/0",
+                "B/1/0",
+            ]
+
+
+def test_nodes_use_slots():
+    """Test that NGFF nodes do not carry an instance `__dict__`"""
+    with TemporaryDirectory() as temp_dir:
+        store_path = os.path.join(temp_dir, "hcs.zarr")
+        plate = open_ome_zarr(
+            store_path, layout="hcs", mode="a", channel_names=["GFP"]
+        )
+        position = plate.create_position("A", "1", "0")
+        position.create_zeros("0", shape=(1, 1, 1, 1, 1), dtype=int)
+        nodes = [plate, plate["A"], plate["A/1"], plate["A/1/0"]]
+        assert not any(hasattr(node, "__dict__") for node in nodes)
+
+
+@given(
+    row_names=plate_axis_names_st,
+    col_names=plate_axis_names_st,
+    prefetch=st.integers(1, 4),
+)
+@settings(max_examples=16, deadline=None)
+def test_plate_positions_prefetch(
+    row_names: list[str], col_names: list[str], prefetch: int
+):
+    """Test `iohub.ngff.Plate.positions()` with prefetching"""
+    with TemporaryDirectory() as temp_dir:
+        store_path = os.path.join(temp_dir, "hcs.zarr")
+        dataset = open_ome_zarr(
+            store_path, layout="hcs", mode="a", channel_names=["GFP"]
+        )
+        for row_name in row_names:
+            for col_name in col_names:
+                position = dataset.create_position(row_name, col_name, "0")
+                position.create_zeros("0", shape=(1, 1, 1, 1, 1), dtype=int)
+        serial = [name for name, _ in dataset.positions()]
+        prefetched = [name for name, _ in dataset.positions(prefetch=prefetch)]
+        assert prefetched == serial
+        assert list(dataset.position_paths()) == serial
+        table = dataset.positions_table()
+        assert table["path"].tolist() == serial
+        assert table["well"].tolist() == [
+            name.rsplit("/", 1)[0] for name in serial
+        ]
+        assert len(serial) == len(row_names) * len(col_names)
+
+
+def test_plate_wells_not_in_metadata():
+    """Test that plate traversal includes well groups
+    missing from the plate metadata"""
+    with TemporaryDirectory() as temp_dir:
+        store_path = os.path.join(temp_dir, "hcs.zarr")
+        dataset = open_ome_zarr(
+            store_path, layout="hcs", mode="a", channel_names=["GFP"]
+        )
+        position = dataset.create_position("A", "1", "0")
+        position.create_zeros("0", shape=(1, 1, 1, 1, 1), dtype=int)
+        # written without going through the plate or the well
+        dataset.zgroup.zeros("A/1/1/0", shape=(1, 1, 1, 1, 1), dtype=int)
+        dataset.zgroup.zeros("E/1/0/0", shape=(1, 1, 1, 1, 1), dtype=int)
+        assert [w.path for w in dataset.metadata.wells] == ["A/1"]
+        assert [i.path for i in dataset["A/1"].metadata.images] == ["0"]
+        assert [name for name, _ in dataset.wells()] == ["A/1", "E/1"]
+        paths = [name for name, _ in dataset.positions()]
+        assert paths == ["A/1/0", "A/1/1", "E/1/0"]
+        assert list(dataset.position_paths()) == paths
+        assert dataset.positions_table()["path"].tolist() == paths
+        assert dataset.count_positions() == len(paths)
+
+
+def test_plate_deleted_position():
+    """Test that plate traversal skips a deleted position
+    still listed in the well metadata"""
+    with TemporaryDirectory() as temp_dir:
+        store_path = os.path.join(temp_dir, "hcs.zarr")
+        dataset = open_ome_zarr(
+            store_path, layout="hcs", mode="a", channel_names=["GFP"]
+        )
+        for pos in ("0", "1"):
+            position = dataset.create_position("A", "1", pos)
+            position.create_zeros("0", shape=(1, 1, 1, 1, 1), dtype=int)
+        del dataset["A/1"]["1"]
+        assert [i.path for i in dataset["A/1"].metadata.images] == ["0", "1"]
+        paths = [name for name, _ in dataset.positions()]
+        assert paths == ["A/1/0"]
+        assert list(dataset.position_paths()) == paths
+        assert dataset.positions_table()["path"].tolist() == paths
+        assert dataset.count_positions() == len(paths)
+
+
+def test_plate_position_paths_without_images():
+    """Test `iohub.ngff.Plate.position_paths()` with well metadata
+    that does not list the images"""
+    with TemporaryDirectory() as temp_dir:
+        store_path = os.path.join(temp_dir, "hcs.zarr")
+        dataset = open_ome_zarr(
+            store_path, layout="hcs", mode="a", channel_names=["GFP"]
+        )
+        for col in ("1", "2"):
+            position = dataset.create_position("A", col, "0")
+            position.create_zeros("0", shape=(1, 1, 1, 1, 1), dtype=int)
+        dataset["A/2"].zattrs["well"] = {"version": "0.4"}
+        paths = [name for name, _ in dataset.positions()]
+        assert paths == ["A/1/0", "A/2/0"]
+        assert list(dataset.position_paths()) == paths
+        assert dataset.positions_table()["path"].tolist() == paths
 
 
 @given(channels_and_random_5d=_channels_and_random_5d())